@@ -44,6 +44,7 @@ class UIContainer(UIElement, IUIContainerInterface, IContainerLikeInterface):
         self.ui_manager = manager
         self.is_window_root_container = is_window_root_container
         self.elements = []  # type: List[IUIElementInterface]
+        self._hover_clip_rect = None  # type: Union[pygame.Rect, None]
         self._layer = 0  # Corrected attribute name
 
         super().__init__(relative_rect, manager, container,
@@ -81,6 +82,35 @@ class UIContainer(UIElement, IUIContainerInterface, IContainerLikeInterface):
         """
         return self.rect
 
+    def get_hover_clip_rect(self) -> pygame.Rect:
+        """
+        The area of the screen in which this container's elements can be hovered. That's the
+        container's rect, cut down to its image clipping rect if it has one.
+
+        Cached until the container's image clip is next set, which happens whenever it is moved
+        or resized. Without an image clip this is the container's own rect, so don't modify it.
+
+        :return: a pygame rectangle
+        """
+        if self._hover_clip_rect is None:
+            hover_clip_rect = super().get_hover_clip_rect()
+            if hover_clip_rect is self.rect:
+                # nothing to cache, and the rect is always current
+                return hover_clip_rect
+            self._hover_clip_rect = hover_clip_rect
+        return self._hover_clip_rect
+
+    def _set_image_clip(self, rect: Union[pygame.Rect, None]):
+        """
+        Sets the clip on this container's image and drops the cached hover clip, so it is
+        rebuilt with the new clip and position.
+
+        :param rect: A clipping rectangle, or None to clear the clip.
+
+        """
+        super()._set_image_clip(rect)
+        self._hover_clip_rect = None
+
     def get_container(self) -> IUIContainerInterface:
         """
         Implements the container interface. In this case we just return this since it is a
@@ -169,7 +199,14 @@ class UIContainer(UIElement, IUIContainerInterface, IContainerLikeInterface):
         to move as well.
         """
         super().update_containing_rect_position()
+        self._update_contained_element_positions()
 
+    def _update_contained_element_positions(self):
+        """
+        Moves the contained UI Elements to match this container's current position. Used
+        directly when this container has already repositioned itself, so we don't recalculate
+        its own anchors a second time.
+        """
         for element in self.elements:
             element.update_containing_rect_position()
 
@@ -184,7 +221,7 @@ class UIContainer(UIElement, IUIContainerInterface, IContainerLikeInterface):
 
         """
         super().set_position(position)
-        self.update_containing_rect_position()
+        self._update_contained_element_positions()
 
     def set_relative_position(self, position: Union[pygame.math.Vector2,
                                                     Tuple[int, int],
@@ -196,7 +233,7 @@ class UIContainer(UIElement, IUIContainerInterface, IContainerLikeInterface):
 
         """
         super().set_relative_position(position)
-        self.update_containing_rect_position()
+        self._update_contained_element_positions()
 
     def set_dimensions(self, dimensions: Union[pygame.math.Vector2,
                                                Tuple[int, int],
@@ -213,7 +250,10 @@ class UIContainer(UIElement, IUIContainerInterface, IContainerLikeInterface):
 
         """
         super().set_dimensions(dimensions)
-        self.update_containing_rect_position()
+        # resizing can move an anchored container, and the base set_dimensions() leaves the
+        # drawable shape where it was
+        self._update_drawable_shape_position()
+        self._update_contained_element_positions()
 
     def get_top_layer(self) -> int:
         """
@@ -1,8 +1,9 @@
 import warnings
-from typing import Union, Tuple, Dict, Optional, Any
+from types import MappingProxyType
+from typing import Union, Tuple, Dict, Optional, Any, Set, List, Callable, Mapping
 
 import pygame
-from pygame_gui.core.utility import translate
+from pygame_gui.core.utility import translate, basic_blit, basic_blits
 
 from pygame_gui.core import ObjectID
 from pygame_gui.core.interfaces import IContainerLikeInterface, IUIManagerInterface
@@ -14,6 +15,64 @@ from pygame_gui.core.text import TextLineChunkFTFont
 
 from pygame.sprite import Sprite  # Import Sprite
 
+# Bit flags for an element's active anchors, packed into UIElement._anchor_mask when the
+# anchors are set so the per-move position updates don't have to re-read the anchor dict.
+_ANCHOR_TOP_TOP = 1 << 0
+_ANCHOR_TOP_BOTTOM = 1 << 1
+_ANCHOR_BOTTOM_TOP = 1 << 2
+_ANCHOR_BOTTOM_BOTTOM = 1 << 3
+_ANCHOR_CENTERY = 1 << 4
+_ANCHOR_LEFT_LEFT = 1 << 5
+_ANCHOR_LEFT_RIGHT = 1 << 6
+_ANCHOR_RIGHT_LEFT = 1 << 7
+_ANCHOR_RIGHT_RIGHT = 1 << 8
+_ANCHOR_CENTERX = 1 << 9
+_ANCHOR_HAS_TARGET = 1 << 10
+
+# plain top left anchoring to the container, by far the most common arrangement
+_ANCHOR_DEFAULT = _ANCHOR_TOP_TOP | _ANCHOR_LEFT_LEFT
+
+_ANCHOR_USES_TOP_OFFSET = _ANCHOR_TOP_TOP | _ANCHOR_BOTTOM_TOP
+_ANCHOR_USES_BOTTOM_OFFSET = _ANCHOR_TOP_BOTTOM | _ANCHOR_BOTTOM_BOTTOM
+_ANCHOR_USES_LEFT_OFFSET = _ANCHOR_LEFT_LEFT | _ANCHOR_RIGHT_LEFT
+_ANCHOR_USES_RIGHT_OFFSET = _ANCHOR_LEFT_RIGHT | _ANCHOR_RIGHT_RIGHT
+_ANCHOR_HORIZONTAL_MASK = (_ANCHOR_USES_LEFT_OFFSET | _ANCHOR_USES_RIGHT_OFFSET |
+                           _ANCHOR_CENTERX)
+
+_ANCHOR_FLAGS = {('top', 'top'): _ANCHOR_TOP_TOP,
+                 ('top', 'bottom'): _ANCHOR_TOP_BOTTOM,
+                 ('bottom', 'top'): _ANCHOR_BOTTOM_TOP,
+                 ('bottom', 'bottom'): _ANCHOR_BOTTOM_BOTTOM,
+                 ('centery', 'centery'): _ANCHOR_CENTERY,
+                 ('left', 'left'): _ANCHOR_LEFT_LEFT,
+                 ('left', 'right'): _ANCHOR_LEFT_RIGHT,
+                 ('right', 'left'): _ANCHOR_RIGHT_LEFT,
+                 ('right', 'right'): _ANCHOR_RIGHT_RIGHT,
+                 ('centerx', 'centerx'): _ANCHOR_CENTERX,
+                 ('center', 'center'): _ANCHOR_CENTERX | _ANCHOR_CENTERY}
+
+_VALID_HORIZONTAL_ANCHORS = frozenset(frozenset(anchor_set.items()) for anchor_set in
+                                      ({'left': 'left', 'right': 'left'},
+                                       {'left': 'right', 'right': 'right'},
+                                       {'left': 'left', 'right': 'right'},
+                                       {'left': 'left'},
+                                       {'right': 'right'},
+                                       {'left': 'right'},
+                                       {'right': 'left'},
+                                       {'centerx': 'centerx'}))
+
+_VALID_VERTICAL_ANCHORS = frozenset(frozenset(anchor_set.items()) for anchor_set in
+                                    ({'top': 'top', 'bottom': 'top'},
+                                     {'top': 'bottom', 'bottom': 'bottom'},
+                                     {'top': 'top', 'bottom': 'bottom'},
+                                     {'top': 'top'},
+                                     {'bottom': 'bottom'},
+                                     {'top': 'bottom'},
+                                     {'bottom': 'top'},
+                                     {'centery': 'centery'}))
+
+_TRANSPARENT_BLACK = pygame.Color(0, 0, 0, 0)
+
 class UIElement(Sprite, IUITextOwnerInterface):
     """
     Base class for GUI elements.
@@ -37,24 +96,27 @@ class UIElement(Sprite, IUITextOwnerInterface):
 
         # Initialize the Sprite class
         super().__init__()  
+        # Default 0 unless initialized differently (e.g. by a container subclass).
+        self._layer = getattr(self, '_layer', 0)
 
         self.relative_rect = relative_rect
         self.manager = manager
         self.container = container
         self.parent_element = parent_element
         self.object_id = object_id
-        self.anchors = anchors
+        self._anchors = {}  # type: Dict[str, Union[str, UIElement]]
+        self._anchor_mask = 0
+        self._anchor_targets = ()  # type: Tuple[UIElement, ...]
+        self.set_anchors(anchors)
         self.visible = visible
         self.starting_height = starting_height
         self.layer_thickness = layer_thickness
         self.text = text
         self.text_colour = text_colour
-        self.bg_colour = bg_colour
+        self.bg_colour = bg_colour if bg_colour is not None else pygame.Color(0, 0, 0, 0)
         self.manager_object_id = manager_object_id
         self.tool_tip_text = tool_tip_text
 
-        self.drawable_shape = RectDrawableShape(self.relative_rect, self.manager.ui_theme)
-
         self._create_valid_ids(container=container,
                                parent_element=parent_element,
                                object_id=object_id,
@@ -73,6 +135,7 @@ class UIElement(Sprite, IUITextOwnerInterface):
         self._last_colour_and_image = None
 
         self.aligned_text_render = None
+        self.active_text_effect = None
         self.tool_tip_text_render = None
 
         self.ui_manager = None
@@ -92,6 +155,8 @@ class UIElement(Sprite, IUITextOwnerInterface):
             self.relative_rect.height = 0
 
         self.drawable_shape = RectDrawableShape(self.relative_rect, self.manager.ui_theme)
+        self._positioned_shape = None
+        self._last_shape_position = None
 
         self.border_colour = None
         self.border_width = 0
@@ -99,8 +164,13 @@ class UIElement(Sprite, IUITextOwnerInterface):
         self.shape_type = 'rect'
 
         self.image = None
+        # True when self.image may be referenced elsewhere (e.g. a drawable shape's state
+        # surface) and so must not be drawn on in place.
+        self._image_is_shared = False
+        self._image_clip = None  # type: Optional[pygame.Rect]
+        self._pre_clipped_image = None  # type: Optional[pygame.surface.Surface]
+        self._container_clip_rect = pygame.Rect(0, 0, 0, 0)
         self.tool_tip_text_surfaces = []
-        self.bg_colour = pygame.Color(0, 0, 0, 0)
         self.is_focused = False
         self.horizontal_scroll_bar = None
         self.vertical_scroll_bar = None
@@ -116,13 +186,6 @@ class UIElement(Sprite, IUITextOwnerInterface):
         self.check_hover_time = 0.5
         self.hover_time = 0.0
 
-
-
-    def change_layer(self, new_layer):
-        self._layer = new_layer
-        self.ui_group.change_layer(self, new_layer)
-
-
     def _get_clamped_to_minimum_dimensions(self, dimensions, clamp_to_container=False):
         if self.ui_container is not None and clamp_to_container:
             dimensions = (min(self.ui_container.rect.width,
@@ -145,64 +208,87 @@ class UIElement(Sprite, IUITextOwnerInterface):
 
     @staticmethod
     def _validate_horizontal_anchors(anchors: Dict[str, Union[str, 'UIElement']]):
-        # first make a dictionary of just the horizontal anchors
-        horizontal_anchors = {}
-
-        if 'left' in anchors:
-            horizontal_anchors.update({'left': anchors['left']})
-        if 'right' in anchors:
-            horizontal_anchors.update({'right': anchors['right']})
-        if 'centerx' in anchors:
-            horizontal_anchors.update({'centerx': anchors['centerx']})
-
-        valid_anchor_set = [{'left': 'left', 'right': 'left'},
-                            {'left': 'right', 'right': 'right'},
-                            {'left': 'left', 'right': 'right'},
-                            {'left': 'left'},
-                            {'right': 'right'},
-                            {'left': 'right'},
-                            {'right': 'left'},
-                            {'centerx': 'centerx'}
-                            ]
-
-        if horizontal_anchors in valid_anchor_set:
+        # first make a hashable set of just the horizontal anchors
+        horizontal_anchors = frozenset((key, anchors[key])
+                                       for key in ('left', 'right', 'centerx')
+                                       if key in anchors)
+
+        if horizontal_anchors in _VALID_HORIZONTAL_ANCHORS:
             return True
         elif len(horizontal_anchors) == 0:
             return False  # no horizontal anchors so just use defaults
         else:
-            warnings.warn("Supplied horizontal anchors are invalid, defaulting to left", category=UserWarning)
+            warnings.warn("Supplied horizontal anchors are invalid, defaulting to left",
+                          category=UserWarning)
             return False
 
     @staticmethod
     def _validate_vertical_anchors(anchors: Dict[str, Union[str, 'UIElement']]):
-        # first make a dictionary of just the vertical anchors
-        vertical_anchors = {}
-
-        if 'top' in anchors:
-            vertical_anchors.update({'top': anchors['top']})
-        if 'bottom' in anchors:
-            vertical_anchors.update({'bottom': anchors['bottom']})
-        if 'centery' in anchors:
-            vertical_anchors.update({'centery': anchors['centery']})
-
-        valid_anchor_set = [{'top': 'top', 'bottom': 'top'},
-                            {'top': 'bottom', 'bottom': 'bottom'},
-                            {'top': 'top', 'bottom': 'bottom'},
-                            {'top': 'top'},
-                            {'bottom': 'bottom'},
-                            {'top': 'bottom'},
-                            {'bottom': 'top'},
-                            {'centery': 'centery'}
-                            ]
-
-        if vertical_anchors in valid_anchor_set:
+        # first make a hashable set of just the vertical anchors
+        vertical_anchors = frozenset((key, anchors[key])
+                                     for key in ('top', 'bottom', 'centery')
+                                     if key in anchors)
+
+        if vertical_anchors in _VALID_VERTICAL_ANCHORS:
             return True
         elif len(vertical_anchors) == 0:
             return False  # no vertical anchors so just use defaults
         else:
-            warnings.warn("Supplied vertical anchors are invalid, defaulting to top", category=UserWarning)
+            warnings.warn("Supplied vertical anchors are invalid, defaulting to top",
+                          category=UserWarning)
             return False
 
+    @property
+    def anchors(self) -> Mapping[str, Union[str, 'UIElement']]:
+        """
+        A read-only view of the dictionary describing what this element's relative_rect is
+        relative to.
+
+        To change the anchors assign a new dictionary, which goes through set_anchors() so the
+        cached anchor mask and targets are rebuilt. Editing the view in place raises TypeError.
+
+        """
+        return MappingProxyType(self._anchors)
+
+    @anchors.setter
+    def anchors(self, anchors: Optional[Dict[str, Union[str, 'UIElement']]]):
+        self.set_anchors(anchors)
+
+    def set_anchors(self, anchors: Optional[Dict[str, Union[str, 'UIElement']]]):
+        """
+        Wraps setting the anchors of this element so that the cached anchor mask, used when
+        updating our position, is rebuilt at the same time.
+
+        :param anchors: A dictionary describing what this element's relative_rect is relative
+                        to. Defaults to the top left of the container if None or empty. It is
+                        copied, as elements often pass their own anchors on to their children.
+
+        """
+        if not anchors:
+            self._anchors = {'left': 'left', 'top': 'top'}
+        else:
+            self._anchors = dict(anchors)
+        self._rebuild_anchor_mask()
+
+    def _rebuild_anchor_mask(self):
+        """
+        Packs the current anchors into a set of bit flags so we don't have to compare anchor
+        strings every time our position is recalculated. Also collects the anchor target
+        elements for get_anchor_targets().
+
+        """
+        anchors = self._anchors
+        anchor_mask = 0
+        for key, value in anchors.items():
+            if isinstance(value, str):
+                anchor_mask |= _ANCHOR_FLAGS.get((key, value), 0)
+            elif key.endswith('_target'):
+                anchor_mask |= _ANCHOR_HAS_TARGET
+        self._anchor_mask = anchor_mask
+        self._anchor_targets = tuple(anchors[key] for key in ('left_target', 'right_target',
+                                                              'top_target', 'bottom_target')
+                                     if key in anchors)
+
     def _setup_visibility(self, visible):
         if visible:
             self.visible = 1
@@ -236,10 +322,22 @@ class UIElement(Sprite, IUITextOwnerInterface):
         self._focus_set = focus_set
 
     def join_focus_sets(self, element: 'UIElement'):
-        if self._focus_set is not None:
-            union_of_sets = set(self._focus_set | element.get_focus_set())
+        focus_set = self._focus_set
+        if focus_set is not None:
+            other_focus_set = element.get_focus_set()
+            if other_focus_set is focus_set:
+                return  # already joined
+            union_of_sets = focus_set | other_focus_set
+            # swap the sets over directly and only tell the manager once, if one of the
+            # joined sets was the one it had focused
+            manager_focus_set = self.ui_manager.get_focus_set()
+            was_focused = False
             for item in union_of_sets:
-                item.set_focus_set(union_of_sets)
+                if item._focus_set is manager_focus_set:
+                    was_focused = True
+                item._focus_set = union_of_sets
+            if was_focused:
+                self.ui_manager.set_focus_set(union_of_sets)
 
     def remove_element_from_focus_set(self, element):
         if self._focus_set is not None:
@@ -296,110 +394,109 @@ class UIElement(Sprite, IUITextOwnerInterface):
         elif isinstance(object_id, ObjectID):
             self.object_ids = [object_id]
         else:
-            self.object_ids = [ObjectID(id=object_id)]
-
-    def _calc_top_offset(self) -> int:
-        return (self.anchors['top_target'].get_abs_rect().bottom
-                if 'top_target' in self.anchors
-                else self.ui_container.get_abs_rect().top)
-
-    def _calc_bottom_offset(self) -> int:
-        return (self.anchors['bottom_target'].get_abs_rect().top
-                if 'bottom_target' in self.anchors
-                else self.ui_container.get_abs_rect().bottom)
-
-    def _calc_centery_offset(self) -> int:
-        return (self.anchors['centery_target'].get_abs_rect().centery
-                if 'centery_target' in self.anchors
-                else self.ui_container.get_abs_rect().centery)
-
-    def _calc_left_offset(self) -> int:
-        return (self.anchors['left_target'].get_abs_rect().right
-                if 'left_target' in self.anchors
-                else self.ui_container.get_abs_rect().left)
-
-    def _calc_right_offset(self) -> int:
-        return (self.anchors['right_target'].get_abs_rect().left
-                if 'right_target' in self.anchors
-                else self.ui_container.get_abs_rect().right)
-
-    def _calc_centerx_offset(self) -> int:
-        return (self.anchors['centerx_target'].get_abs_rect().centerx
-                if 'centerx_target' in self.anchors
-                else self.ui_container.get_abs_rect().centerx)
+            self.object_ids = [ObjectID(object_id=object_id, class_id=None)]
 
     def _update_absolute_rect_position_from_anchors(self, recalculate_margins=False):
         """
         Called when our element's relative position has changed.
         """
+        anchors = self._anchors
+        anchor_mask = self._anchor_mask
+        container_rect = self.ui_container.get_abs_rect()
+
+        if anchor_mask == _ANCHOR_DEFAULT:
+            rr = self.relative_rect
+            self.rect.left = rr.left + container_rect.left
+            self.rect.top = rr.top + container_rect.top
+            new_width, new_height = self._get_clamped_to_minimum_dimensions(rr.size)
+            if (new_height != rr.height) or (new_width != rr.width):
+                self.set_dimensions((new_width, new_height))
+            return
+
+        rr = self.relative_rect
+        rr_top, rr_bottom, rr_left, rr_right = rr.top, rr.bottom, rr.left, rr.right
+        rr_width, rr_height = rr.width, rr.height
+
         new_top = 0
         new_bottom = 0
-        top_offset = self._calc_top_offset()
-        bottom_offset = self._calc_bottom_offset()
-
-        center_x_and_y = False
-
-        if 'center' in self.anchors:
-            if self.anchors['center'] == 'center':
-                center_x_and_y = True
-
-        if ('centery' in self.anchors and self.anchors['centery'] == 'centery') or center_x_and_y:
-            centery_offset = self._calc_centery_offset()
-            new_top = self.relative_rect.top - self.relative_rect.height//2 + centery_offset
-            new_bottom = self.relative_rect.bottom - self.relative_rect.height//2 + centery_offset
-
-        if 'top' in self.anchors:
-            if self.anchors['top'] == 'top':
-                new_top = self.relative_rect.top + top_offset
-                new_bottom = self.relative_rect.bottom + top_offset
-            elif self.anchors['top'] == 'bottom':
-                new_top = self.relative_rect.top + bottom_offset
-                if self.relative_bottom_margin is None or recalculate_margins:
-                    self.relative_bottom_margin = (bottom_offset -
-                                                   (new_top + self.relative_rect.height))
-                new_bottom = bottom_offset - self.relative_bottom_margin
-
-        if 'bottom' in self.anchors:
-            if self.anchors['bottom'] == 'top':
-                new_top = self.relative_rect.top + top_offset
-                new_bottom = self.relative_rect.bottom + top_offset
-            elif self.anchors['bottom'] == 'bottom':
-                if not ('top' in self.anchors and self.anchors['top'] == 'top'):
-                    new_top = self.relative_rect.top + bottom_offset
-                if self.relative_bottom_margin is None or recalculate_margins:
-                    self.relative_bottom_margin = (bottom_offset -
-                                                   (new_top + self.relative_rect.height))
-                new_bottom = bottom_offset - self.relative_bottom_margin
+        # only look up the offsets our vertical anchors actually reference
+        top_offset = 0
+        if anchor_mask & _ANCHOR_USES_TOP_OFFSET:
+            target = anchors.get('top_target')
+            top_offset = (target.get_abs_rect().bottom if target is not None
+                          else container_rect.top)
+        bottom_offset = 0
+        if anchor_mask & _ANCHOR_USES_BOTTOM_OFFSET:
+            target = anchors.get('bottom_target')
+            bottom_offset = (target.get_abs_rect().top if target is not None
+                             else container_rect.bottom)
+
+        if anchor_mask & _ANCHOR_CENTERY:
+            target = anchors.get('centery_target')
+            centery_offset = (target.get_abs_rect().centery if target is not None
+                              else container_rect.centery)
+            half_height = rr_height >> 1
+            new_top = rr_top - half_height + centery_offset
+            new_bottom = rr_bottom - half_height + centery_offset
+
+        if anchor_mask & _ANCHOR_TOP_TOP:
+            new_top = rr_top + top_offset
+            new_bottom = rr_bottom + top_offset
+        elif anchor_mask & _ANCHOR_TOP_BOTTOM:
+            new_top = rr_top + bottom_offset
+            if self.relative_bottom_margin is None or recalculate_margins:
+                self.relative_bottom_margin = bottom_offset - (new_top + rr_height)
+            new_bottom = bottom_offset - self.relative_bottom_margin
+
+        if anchor_mask & _ANCHOR_BOTTOM_TOP:
+            new_top = rr_top + top_offset
+            new_bottom = rr_bottom + top_offset
+        elif anchor_mask & _ANCHOR_BOTTOM_BOTTOM:
+            if not anchor_mask & _ANCHOR_TOP_TOP:
+                new_top = rr_top + bottom_offset
+            if self.relative_bottom_margin is None or recalculate_margins:
+                self.relative_bottom_margin = bottom_offset - (new_top + rr_height)
+            new_bottom = bottom_offset - self.relative_bottom_margin
 
         new_left = 0
         new_right = 0
-        left_offset = self._calc_left_offset()
-        right_offset = self._calc_right_offset()
-
-        if ('centerx' in self.anchors and self.anchors['centerx'] == 'centerx') or center_x_and_y:
-            centerx_offset = self._calc_centerx_offset()
-            new_left = self.relative_rect.left - self.relative_rect.width//2 + centerx_offset
-            new_right = self.relative_rect.right - self.relative_rect.width//2 + centerx_offset
-
-        if 'left' in self.anchors:
-            if self.anchors['left'] == 'left':
-                new_left = self.relative_rect.left + left_offset
-                new_right = self.relative_rect.right + left_offset
-            elif self.anchors['left'] == 'right':
-                new_left = self.relative_rect.left + right_offset
+        if anchor_mask & _ANCHOR_HORIZONTAL_MASK:
+            left_offset = 0
+            if anchor_mask & _ANCHOR_USES_LEFT_OFFSET:
+                target = anchors.get('left_target')
+                left_offset = (target.get_abs_rect().right if target is not None
+                               else container_rect.left)
+            right_offset = 0
+            if anchor_mask & _ANCHOR_USES_RIGHT_OFFSET:
+                target = anchors.get('right_target')
+                right_offset = (target.get_abs_rect().left if target is not None
+                                else container_rect.right)
+
+            if anchor_mask & _ANCHOR_CENTERX:
+                target = anchors.get('centerx_target')
+                centerx_offset = (target.get_abs_rect().centerx if target is not None
+                                  else container_rect.centerx)
+                half_width = rr_width >> 1
+                new_left = rr_left - half_width + centerx_offset
+                new_right = rr_right - half_width + centerx_offset
+
+            if anchor_mask & _ANCHOR_LEFT_LEFT:
+                new_left = rr_left + left_offset
+                new_right = rr_right + left_offset
+            elif anchor_mask & _ANCHOR_LEFT_RIGHT:
+                new_left = rr_left + right_offset
                 if self.relative_right_margin is None or recalculate_margins:
-                    self.relative_right_margin = (right_offset - (new_left + self.relative_rect.width))
+                    self.relative_right_margin = right_offset - (new_left + rr_width)
                 new_right = right_offset - self.relative_right_margin
 
-        if 'right' in self.anchors:
-            if self.anchors['right'] == 'left':
-                new_left = self.relative_rect.left + left_offset
-                new_right = self.relative_rect.right + left_offset
-            elif self.anchors['right'] == 'right':
-                if not ('left' in self.anchors and self.anchors['left'] == 'left'):
-                    new_left = self.relative_rect.left + right_offset
+            if anchor_mask & _ANCHOR_RIGHT_LEFT:
+                new_left = rr_left + left_offset
+                new_right = rr_right + left_offset
+            elif anchor_mask & _ANCHOR_RIGHT_RIGHT:
+                if not anchor_mask & _ANCHOR_LEFT_LEFT:
+                    new_left = rr_left + right_offset
                 if self.relative_right_margin is None or recalculate_margins:
-                    self.relative_right_margin = (right_offset - (new_left + self.relative_rect.width))
+                    self.relative_right_margin = right_offset - (new_left + rr_width)
                 new_right = right_offset - self.relative_right_margin
 
         self.rect.left = new_left
@@ -407,7 +504,7 @@ class UIElement(Sprite, IUITextOwnerInterface):
         new_height = new_bottom - new_top
         new_width = new_right - new_left
         new_width, new_height = self._get_clamped_to_minimum_dimensions((new_width, new_height))
-        if (new_height != self.relative_rect.height) or (new_width != self.relative_rect.width):
+        if (new_height != rr_height) or (new_width != rr_width):
             self.set_dimensions((new_width, new_height))
 
     def _update_relative_rect_position_from_anchors(self, recalculate_margins=False):
@@ -423,84 +520,111 @@ class UIElement(Sprite, IUITextOwnerInterface):
         self.relative_bottom_margin = None
         self.relative_right_margin = None
 
+        anchors = self._anchors
+        anchor_mask = self._anchor_mask
+        container_rect = self.ui_container.get_abs_rect()
+
+        if anchor_mask == _ANCHOR_DEFAULT:
+            self.relative_rect.topleft = (self.rect.left - container_rect.left,
+                                          self.rect.top - container_rect.top)
+            return
+
+        rect = self.rect
+        rect_top, rect_bottom, rect_left, rect_right = rect.top, rect.bottom, rect.left, rect.right
+        rr = self.relative_rect
+
         new_top = 0
         new_bottom = 0
-        top_offset = self._calc_top_offset()
-        bottom_offset = self._calc_bottom_offset()
-
-        center_x_and_y = False
-        if 'center' in self.anchors:
-            if self.anchors['center'] == 'center':
-                center_x_and_y = True
-
-        if ('centery' in self.anchors and self.anchors['centery'] == 'centery') or center_x_and_y:
-            centery_offset = self._calc_centery_offset()
-            new_top = self.rect.top + self.relative_rect.height//2 - centery_offset
-            new_bottom = self.rect.bottom + self.relative_rect.height//2 - centery_offset
-
-        if 'top' in self.anchors:
-            if self.anchors['top'] == 'top':
-                new_top = self.rect.top - top_offset
-                new_bottom = self.rect.bottom - top_offset
-            elif self.anchors['top'] == 'bottom':
-                new_top = self.rect.top - bottom_offset
-                if self.relative_bottom_margin is None or recalculate_margins:
-                    self.relative_bottom_margin = bottom_offset - self.rect.bottom
-                new_bottom = self.rect.bottom - bottom_offset
-
-        if 'bottom' in self.anchors:
-            if self.anchors['bottom'] == 'top':
-                new_top = self.rect.top - top_offset
-                new_bottom = self.rect.bottom - top_offset
-            elif self.anchors['bottom'] == 'bottom':
-                if not ('top' in self.anchors and self.anchors['top'] == 'top'):
-                    new_top = self.rect.top - bottom_offset
-                if self.relative_bottom_margin is None or recalculate_margins:
-                    self.relative_bottom_margin = bottom_offset - self.rect.bottom
-                new_bottom = self.rect.bottom - bottom_offset
+        top_offset = 0
+        if anchor_mask & _ANCHOR_USES_TOP_OFFSET:
+            target = anchors.get('top_target')
+            top_offset = (target.get_abs_rect().bottom if target is not None
+                          else container_rect.top)
+        bottom_offset = 0
+        if anchor_mask & _ANCHOR_USES_BOTTOM_OFFSET:
+            target = anchors.get('bottom_target')
+            bottom_offset = (target.get_abs_rect().top if target is not None
+                             else container_rect.bottom)
+
+        if anchor_mask & _ANCHOR_CENTERY:
+            target = anchors.get('centery_target')
+            centery_offset = (target.get_abs_rect().centery if target is not None
+                              else container_rect.centery)
+            half_height = rr.height >> 1
+            new_top = rect_top + half_height - centery_offset
+            new_bottom = rect_bottom + half_height - centery_offset
+
+        if anchor_mask & _ANCHOR_TOP_TOP:
+            new_top = rect_top - top_offset
+            new_bottom = rect_bottom - top_offset
+        elif anchor_mask & _ANCHOR_TOP_BOTTOM:
+            new_top = rect_top - bottom_offset
+            if self.relative_bottom_margin is None or recalculate_margins:
+                self.relative_bottom_margin = bottom_offset - rect_bottom
+            new_bottom = rect_bottom - bottom_offset
+
+        if anchor_mask & _ANCHOR_BOTTOM_TOP:
+            new_top = rect_top - top_offset
+            new_bottom = rect_bottom - top_offset
+        elif anchor_mask & _ANCHOR_BOTTOM_BOTTOM:
+            if not anchor_mask & _ANCHOR_TOP_TOP:
+                new_top = rect_top - bottom_offset
+            if self.relative_bottom_margin is None or recalculate_margins:
+                self.relative_bottom_margin = bottom_offset - rect_bottom
+            new_bottom = rect_bottom - bottom_offset
 
         new_left = 0
         new_right = 0
-        left_offset = self._calc_left_offset()
-        right_offset = self._calc_right_offset()
-
-        if ('centerx' in self.anchors and self.anchors['centerx'] == 'centerx') or center_x_and_y:
-            centerx_offset = self._calc_centerx_offset()
-            new_left = self.rect.left + self.relative_rect.width//2 - centerx_offset
-            new_right = self.rect.right + self.relative_rect.width//2 - centerx_offset
-
-        if 'left' in self.anchors:
-            if self.anchors['left'] == 'left':
-                new_left = self.rect.left - left_offset
-                new_right = self.rect.right - left_offset
-            elif self.anchors['left'] == 'right':
-                new_left = self.rect.left - right_offset
+        if anchor_mask & _ANCHOR_HORIZONTAL_MASK:
+            left_offset = 0
+            if anchor_mask & _ANCHOR_USES_LEFT_OFFSET:
+                target = anchors.get('left_target')
+                left_offset = (target.get_abs_rect().right if target is not None
+                               else container_rect.left)
+            right_offset = 0
+            if anchor_mask & _ANCHOR_USES_RIGHT_OFFSET:
+                target = anchors.get('right_target')
+                right_offset = (target.get_abs_rect().left if target is not None
+                                else container_rect.right)
+
+            if anchor_mask & _ANCHOR_CENTERX:
+                target = anchors.get('centerx_target')
+                centerx_offset = (target.get_abs_rect().centerx if target is not None
+                                  else container_rect.centerx)
+                half_width = rr.width >> 1
+                new_left = rect_left + half_width - centerx_offset
+                new_right = rect_right + half_width - centerx_offset
+
+            if anchor_mask & _ANCHOR_LEFT_LEFT:
+                new_left = rect_left - left_offset
+                new_right = rect_right - left_offset
+            elif anchor_mask & _ANCHOR_LEFT_RIGHT:
+                new_left = rect_left - right_offset
                 if self.relative_right_margin is None or recalculate_margins:
-                    self.relative_right_margin = right_offset - self.rect.right
-                new_right = self.rect.right - right_offset
-
-        if 'right' in self.anchors:
-            if self.anchors['right'] == 'left':
-                new_left = self.rect.left - left_offset
-                new_right = self.rect.right - left_offset
-            elif self.anchors['right'] == 'right':
-                if not ('left' in self.anchors and self.anchors['left'] == 'left'):
-                    new_left = self.rect.left - right_offset
+                    self.relative_right_margin = right_offset - rect_right
+                new_right = rect_right - right_offset
+
+            if anchor_mask & _ANCHOR_RIGHT_LEFT:
+                new_left = rect_left - left_offset
+                new_right = rect_right - left_offset
+            elif anchor_mask & _ANCHOR_RIGHT_RIGHT:
+                if not anchor_mask & _ANCHOR_LEFT_LEFT:
+                    new_left = rect_left - right_offset
                 if self.relative_right_margin is None or recalculate_margins:
-                    self.relative_right_margin = right_offset - self.rect.right
-                new_right = self.rect.right - right_offset
+                    self.relative_right_margin = right_offset - rect_right
+                new_right = rect_right - right_offset
 
         # set bottom and right first in case these are only anchors available
-        self.relative_rect.bottom = new_bottom
-        self.relative_rect.right = new_right
+        rr.bottom = new_bottom
+        rr.right = new_right
 
         # set top and left last to give these priority, in most cases where all anchors are set
         # we want relative_rect parameters to be correct for whatever the top & left sides are
         # anchored to. The data for the bottom and right in cases where left is anchored
         # differently to right and/or top is anchored differently to bottom should be captured by
         # the bottom and right margins.
-        self.relative_rect.left = new_left
-        self.relative_rect.top = new_top
+        rr.left = new_left
+        rr.top = new_top
 
     def _update_container_clip(self):
         """
@@ -508,41 +632,50 @@ class UIElement(Sprite, IUITextOwnerInterface):
         element is inside its container, part-way in it, or all the way out of it.
 
         """
-        if self.ui_container.get_image_clipping_rect() is not None:
-            container_clip_rect = self.ui_container.get_image_clipping_rect().copy()
-            container_clip_rect.left += self.ui_container.get_rect().left
-            container_clip_rect.top += self.ui_container.get_rect().top
-            if not container_clip_rect.contains(self.rect):
-                left = max(0, container_clip_rect.left - self.rect.left)
-                right = max(0, self.rect.width - max(0,
-                                                     self.rect.right -
-                                                     container_clip_rect.right))
-                top = max(0, container_clip_rect.top - self.rect.top)
-                bottom = max(0, self.rect.height - max(0,
-                                                       self.rect.bottom -
-                                                       container_clip_rect.bottom))
-                clip_rect = pygame.Rect(left, top,
-                                        max(0, right - left),
-                                        max(0, bottom - top))
-                self._clip_images_for_container(clip_rect)
-            else:
-                self._restore_container_clipped_images()
-
-        elif not self.ui_container.get_rect().contains(self.rect):
-            left = max(0, self.ui_container.get_rect().left - self.rect.left)
-            right = max(0, self.rect.width - max(0,
-                                                 self.rect.right -
-                                                 self.ui_container.get_rect().right))
-            top = max(0, self.ui_container.get_rect().top - self.rect.top)
-            bottom = max(0, self.rect.height - max(0,
-                                                   self.rect.bottom -
-                                                   self.ui_container.get_rect().bottom))
-            clip_rect = pygame.Rect(left, top,
-                                    max(0, right - left),
-                                    max(0, bottom - top))
-            self._clip_images_for_container(clip_rect)
-        else:
+        container_clip = self.ui_container.get_hover_clip_rect()
+        clip_left = container_clip.left
+        clip_top = container_clip.top
+        clip_right = container_clip.right
+        clip_bottom = container_clip.bottom
+
+        rect = self.rect
+        rect_left = rect.left
+        rect_top = rect.top
+        rect_right = rect.right
+        rect_bottom = rect.bottom
+
+        # the same test as container_clip.contains(rect), which also needs our top left corner
+        # strictly inside the clip, so zero sized rects on or past its far edges get clipped
+        if (clip_left <= rect_left < clip_right and clip_top <= rect_top < clip_bottom and
+                rect_right <= clip_right and rect_bottom <= clip_bottom):
+            # we are entirely inside the container's clip
             self._restore_container_clipped_images()
+        else:
+            width = rect.width
+            height = rect.height
+            left = max(0, clip_left - rect_left)
+            right = max(0, width - max(0, rect_right - clip_right))
+            top = max(0, clip_top - rect_top)
+            bottom = max(0, height - max(0, rect_bottom - clip_bottom))
+
+            # reuse the same rect every time rather than allocating a new one per update
+            clip_rect = self._container_clip_rect
+            clip_rect.update(left, top, max(0, right - left), max(0, bottom - top))
+            self._clip_images_for_container(clip_rect)
+
+    def _update_drawable_shape_position(self):
+        """
+        Moves our drawable shape to match our absolute rect, skipping the call when this same
+        shape was already placed at this position.
+
+        """
+        if self.drawable_shape is not None:
+            position = self.rect.topleft
+            if (self.drawable_shape is not self._positioned_shape or
+                    position != self._last_shape_position):
+                self.drawable_shape.set_position(position)
+                self._positioned_shape = self.drawable_shape
+                self._last_shape_position = position
 
     def update_containing_rect_position(self):
         """
@@ -551,8 +684,7 @@ class UIElement(Sprite, IUITextOwnerInterface):
         """
         self._update_absolute_rect_position_from_anchors()
 
-        if self.drawable_shape is not None:
-            self.drawable_shape.set_position(self.rect.topleft)
+        self._update_drawable_shape_position()
 
         self._update_container_clip()
 
@@ -570,8 +702,7 @@ class UIElement(Sprite, IUITextOwnerInterface):
 
         self._update_absolute_rect_position_from_anchors(recalculate_margins=True)
 
-        if self.drawable_shape is not None:
-            self.drawable_shape.set_position(self.rect.topleft)
+        self._update_drawable_shape_position()
 
         self._update_container_clip()
         self.ui_container.on_anchor_target_changed(self)
@@ -589,8 +720,7 @@ class UIElement(Sprite, IUITextOwnerInterface):
         self.rect.y = int(position[1])
         self._update_relative_rect_position_from_anchors(recalculate_margins=True)
 
-        if self.drawable_shape is not None:
-            self.drawable_shape.set_position(self.rect.topleft)
+        self._update_drawable_shape_position()
         self._update_container_clip()
         self.ui_container.on_anchor_target_changed(self)
 
@@ -629,12 +759,13 @@ class UIElement(Sprite, IUITextOwnerInterface):
                                    dimensions of the container or not.
 
         """
-        dimensions = self._get_clamped_to_minimum_dimensions(dimensions, clamp_to_container)
-        self.relative_rect.width = int(dimensions[0])
-        self.relative_rect.height = int(dimensions[1])
-        self.rect.size = self.relative_rect.size
+        # the clamped dimensions are already ints
+        width, height = self._get_clamped_to_minimum_dimensions(dimensions, clamp_to_container)
+        self.relative_rect.width = width
+        self.relative_rect.height = height
+        self.rect.size = (width, height)
 
-        if dimensions[0] >= 0 and dimensions[1] >= 0:
+        if width >= 0 and height >= 0:
             self._update_absolute_rect_position_from_anchors(recalculate_margins=True)
 
             if self.drawable_shape is not None:
@@ -645,39 +776,23 @@ class UIElement(Sprite, IUITextOwnerInterface):
             self._update_container_clip()
             self.ui_container.on_anchor_target_changed(self)
 
-def update(self, time_delta: float):
-    """
-    Update the UI element.
-    """
-    if not self.is_enabled:
-        self.hovered = False
-        self._hovering(False)
-        return
-
-    mouse_x, mouse_y = pygame.mouse.get_pos()
-
-    if self.container:
-        if self.container.rect.collidepoint(mouse_x, mouse_y):
-            mouse_x -= self.container.rect.x
-            mouse_y -= self.container.rect.y
-
-    # Update text effect if active
-    if self.active_text_effect is not None:
-        self.active_text_effect.update(time_delta)
-
-    # Call superclass update
-    super().update(time_delta)
-
-    # Check if mouse is over the element
-    if self.rect.collidepoint(mouse_x, mouse_y):
-        if not self.hovered:
-            self._hovering(True)
-            self.hovered = True
-    else:
-        if self.hovered:
-            self._hovering(False)
+    def update(self, time_delta: float):
+        """
+        Update the UI element.
+
+        Hover state is not tested here; the UIManager works that out for every element once per
+        frame in its hover pass (see check_hover()).
+        """
+        if not self.is_enabled:
             self.hovered = False
+            return
 
+        # Update text effect if active
+        if self.active_text_effect is not None:
+            self.active_text_effect.update(time_delta)
+
+        # Call superclass update
+        super().update(time_delta)
 
     def change_layer(self, new_layer: int):
         """
@@ -716,7 +831,6 @@ def update(self, time_delta: float):
         should_block_hover = False
         if self.alive():
             mouse_x, mouse_y = self.ui_manager.get_mouse_position()
-            mouse_pos = pygame.math.Vector2(mouse_x, mouse_y)
 
             if (self.hover_point(mouse_x, mouse_y) and
                     not hovered_higher_element):
@@ -727,7 +841,7 @@ def update(self, time_delta: float):
                         self.hovered = True
                         self.on_hovered()
 
-                    self.while_hovering(time_delta, mouse_pos)
+                    self.while_hovering(time_delta, (mouse_x, mouse_y))
                 else:
                     if self.hovered:
                         self.hovered = False
@@ -751,7 +865,8 @@ def update(self, time_delta: float):
         """
         Called when this UI element first enters the 'hovered' state.
         """
-        self.hover_time = 0.0
+        if self.tool_tip_text is not None:
+            self.hover_time = 0.0
 
     def on_unhovered(self):
         """
@@ -771,8 +886,11 @@ def update(self, time_delta: float):
         :param mouse_pos: The current position of the mouse.
 
         """
-        if (self.tool_tip is None and self.tool_tip_text is not None and
-                self.hover_time > self.tool_tip_delay):
+        if self.tool_tip_text is None:
+            # hover time is only used to time tool tips
+            return
+
+        if self.tool_tip is None and self.hover_time > self.tool_tip_delay:
             hover_height = int(self.rect.height / 2)
             self.tool_tip = self.ui_manager.create_tool_tip(text=self.tool_tip_text,
                                                             position=(mouse_pos[0],
@@ -805,19 +923,20 @@ def update(self, time_delta: float):
         :return: Returns True if we are hovering this element.
 
         """
+        # cheapest tests first, the shape collision test only runs for points inside our rect
+        clip = self.ui_container.get_hover_clip_rect()
+        clip_x, clip_y = clip.x, clip.y
+        if not (clip_x <= hover_x < clip_x + clip.w and clip_y <= hover_y < clip_y + clip.h):
+            return False
 
-        container_clip_rect = self.ui_container.get_rect().copy()
-        if self.ui_container.get_image_clipping_rect() is not None:
-            container_clip_rect.size = self.ui_container.get_image_clipping_rect().size
-            container_clip_rect.left += self.ui_container.get_image_clipping_rect().left
-            container_clip_rect.top += self.ui_container.get_image_clipping_rect().top
+        rect = self.rect
+        rect_x, rect_y = rect.x, rect.y
+        if not (rect_x <= hover_x < rect_x + rect.w and rect_y <= hover_y < rect_y + rect.h):
+            return False
 
         if self.drawable_shape is not None:
-            return (self.drawable_shape.collide_point((hover_x, hover_y)) and
-                    bool(container_clip_rect.collidepoint(hover_x, hover_y)))
-
-        return (bool(self.rect.collidepoint(hover_x, hover_y)) and
-                bool(container_clip_rect.collidepoint(hover_x, hover_y)))
+            return self.drawable_shape.collide_point((hover_x, hover_y))
+        return True
 
     # pylint: disable=unused-argument,no-self-use
     def process_event(self, event: pygame.event.Event) -> bool:
@@ -869,9 +988,8 @@ def update(self, time_delta: float):
 
         """
         if activate_mode:
-            default_font = self.ui_manager.get_theme().get_font_dictionary().get_default_font()
-            layer_text_render = render_white_text_alpha_black_bg(default_font,
-                                                                 "UI Layer: " + str(self._layer))
+            # shared with other elements on this layer, so it is only ever blitted from
+            layer_text_render = self.ui_manager.get_visual_debug_layer_text(self._layer)
 
             if self.image is not None:
                 self.pre_debug_image = self.image.copy()
@@ -891,9 +1009,13 @@ def update(self, time_delta: float):
                     new_surface = pygame.surface.Surface((surf_width, surf_height),
                                                          flags=pygame.SRCALPHA,
                                                          depth=32)
-                    basic_blit(new_surface, self.image, (0, 0))
+                    basic_blits(new_surface, ((self.image, (0, 0)), (layer_text_render, (0, 0))))
                     self._set_image(new_surface)
-                basic_blit(self.image, layer_text_render, (0, 0))
+                else:
+                    if self._image_is_shared:
+                        self.image = self.image.copy()
+                        self._image_is_shared = False
+                    basic_blit(self.image, layer_text_render, (0, 0))
             else:
                 self._set_image(layer_text_render)
             self._visual_debug_mode = True
@@ -929,15 +1051,13 @@ def update(self, time_delta: float):
             rect.width = max(rect.width, 0)
             rect.height = max(rect.height, 0)
 
-            if self._pre_clipped_image is None and self.image is not None:
-                self._pre_clipped_image = self.image.copy()
+            image = self.image
+            if self._pre_clipped_image is None and image is not None:
+                self._pre_clipped_image = image if self._image_is_shared else image.copy()
 
             self._image_clip = rect
-            if self.image is not None:
-                if self.image.get_size() != self._pre_clipped_image.get_size():
-                    self.image = pygame.Surface(self._pre_clipped_image.get_size(), flags=pygame.SRCALPHA, depth=32)
-                self.image.fill(pygame.Color('#00000000'))
-                basic_blit(self.image, self._pre_clipped_image, self._image_clip, self._image_clip)
+            if image is not None:
+                self._apply_image_clip(self._pre_clipped_image, rect)
 
         elif self._image_clip is not None:
             self._image_clip = None
@@ -945,6 +1065,50 @@ def update(self, time_delta: float):
         else:
             self._image_clip = None
 
+    def _apply_image_clip(self, pre_clipped_image: pygame.surface.Surface, clip: pygame.Rect):
+        """
+        Sets this element's image to the part of the pre-clipped image inside the clip, with
+        the rest left transparent. Clips that hide all or none of the image reuse an existing
+        surface rather than filling and blitting a new one.
+
+        :param pre_clipped_image: The full, unclipped image.
+        :param clip: The clipping rectangle, in the image's coordinates.
+
+        """
+        width, height = pre_clipped_image.get_size()
+        if clip.width == 0 and clip.height == 0:
+            self.image = self.ui_manager.get_universal_empty_surface()
+            self._image_is_shared = True
+        elif clip.x <= 0 and clip.y <= 0 and clip.right >= width and clip.bottom >= height:
+            self.image = pre_clipped_image
+            self._image_is_shared = True
+        else:
+            image = self.image
+            if self._image_is_shared or image is None or image.get_size() != (width, height):
+                image = pygame.surface.Surface((width, height), flags=pygame.SRCALPHA, depth=32)
+                self.image = image
+                self._image_is_shared = False
+            image.fill(_TRANSPARENT_BLACK)
+            basic_blit(image, pre_clipped_image, clip, clip)
+
+    def get_hover_clip_rect(self) -> pygame.Rect:
+        """
+        The visible area of this element on the screen, which is also the area in which any
+        elements it contains can be hovered. That's our rect, cut down to our image clipping
+        rect if we have one.
+
+        Without an image clip this is our own rect, so don't modify it.
+
+        :return: a pygame rectangle
+        """
+        image_clip = self._image_clip
+        if image_clip is None:
+            return self.rect
+        return pygame.Rect(self.rect.left + image_clip.left,
+                           self.rect.top + image_clip.top,
+                           image_clip.width,
+                           image_clip.height)
+
     def get_image_clipping_rect(self) -> Union[pygame.Rect, None]:
         """
         Obtain the current image clipping rect.
@@ -965,7 +1129,8 @@ def update(self, time_delta: float):
         """
         warnings.warn("This method will be removed for "
                       "most elements from version 0.8.0", DeprecationWarning, stacklevel=2)
-        self._set_image(new_image)
+        # the caller still holds this surface, so don't keep a reference to it
+        self._set_image(new_image.copy() if new_image is not None else None)
 
     def _set_image(self, new_image: Union[pygame.surface.Surface, None]):
         """
@@ -975,22 +1140,15 @@ def update(self, time_delta: float):
         :param new_image: The new image to set.
 
         """
-        if self.get_image_clipping_rect() is not None and new_image is not None:
+        clip = self._image_clip
+        if clip is not None and new_image is not None:
             self._pre_clipped_image = new_image
-            if (self.get_image_clipping_rect().width == 0 and
-                    self.get_image_clipping_rect().height == 0):
-                self.image = self.ui_manager.get_universal_empty_surface()
-            else:
-                self.image = pygame.surface.Surface(self._pre_clipped_image.get_size(),
-                                                    flags=pygame.SRCALPHA,
-                                                    depth=32)
-                self.image.fill(pygame.Color('#00000000'))
-                basic_blit(self.image,
-                           self._pre_clipped_image,
-                           self.get_image_clipping_rect(),
-                           self.get_image_clipping_rect())
+            self._apply_image_clip(new_image, clip)
         else:
-            self.image = new_image.copy() if new_image is not None else None
+            # no copy here, most images come straight from a drawable shape's state surfaces.
+            # Anything that wants to draw on the image in place checks _image_is_shared first.
+            self.image = new_image
+            self._image_is_shared = new_image is not None
             self._pre_clipped_image = None
 
     def get_top_layer(self) -> int:
@@ -1020,19 +1178,13 @@ def update(self, time_delta: float):
         :param defaults: A dictionary of default values
         :return: True if any have changed.
         """
-        has_any_changed = False
-
-        if self._check_misc_theme_data_changed('border_width', defaults['border_width'], int):
-            has_any_changed = True
-
-        if self._check_misc_theme_data_changed('shadow_width', defaults['shadow_width'], int):
-            has_any_changed = True
-
-        if self._check_misc_theme_data_changed('shape_corner_radius',
-                                               defaults['shape_corner_radius'], int):
-            has_any_changed = True
-
-        return has_any_changed
+        # '|' rather than 'or' - every check has to run to update its attribute
+        return (self._check_misc_theme_data_changed('border_width',
+                                                    defaults['border_width'], int) |
+                self._check_misc_theme_data_changed('shadow_width',
+                                                    defaults['shadow_width'], int) |
+                self._check_misc_theme_data_changed('shape_corner_radius',
+                                                    defaults['shape_corner_radius'], int))
 
     def _check_misc_theme_data_changed(self,
                                        attribute_name: str,
@@ -1061,8 +1213,10 @@ def update(self, time_delta: float):
             if allowed_values and attribute_value not in allowed_values:
                 attribute_value = default_value
 
-            if attribute_value != getattr(self, attribute_name, default_value):
-                setattr(self, attribute_name, attribute_value)
+            # theming attributes are plain instance attributes, never properties, so go
+            # straight to the instance dictionary
+            if attribute_value != self.__dict__.get(attribute_name, default_value):
+                self.__dict__[attribute_name] = attribute_value
                 has_changed = True
         return has_changed
 
@@ -1113,23 +1267,18 @@ def update(self, time_delta: float):
     def on_locale_changed(self):
         pass
 
-    def get_anchor_targets(self) -> list:
-        targets = []
-        if 'left_target' in self.anchors:
-            targets.append(self.anchors['left_target'])
-        if 'right_target' in self.anchors:
-            targets.append(self.anchors['right_target'])
-        if 'top_target' in self.anchors:
-            targets.append(self.anchors['top_target'])
-        if 'bottom_target' in self.anchors:
-            targets.append(self.anchors['bottom_target'])
+    def get_anchor_targets(self) -> Tuple['UIElement', ...]:
+        """
+        Get the elements this element is anchored to, collected when the anchors were last set.
 
-        return targets
+        :return: A tuple of anchor target elements, in left, right, top, bottom order.
+        """
+        return self._anchor_targets
 
     @staticmethod
     def tuple_extract(str_data: str) -> Tuple[int, int]:
         # Used for parsing coordinate tuples in themes.
-        x, y = str_data.split(',')
+        x, _, y = str_data.partition(',')
         return int(x), int(y)
 
     def update_theming(self, new_theming_data: str):
@@ -1147,6 +1296,9 @@ def update(self, time_delta: float):
     def set_tooltip(self, text: Optional[str] = None, object_id: Optional[ObjectID] = None,
                     text_kwargs: Optional[Dict[str, str]] = None, delay: Optional[float] = None,
                     wrap_width: Optional[int] = None):
+        if self.tool_tip_text is None:
+            # hover time isn't tracked without tool tip text, so start the delay from now
+            self.hover_time = 0.0
         self.tool_tip_text = text
         self.tool_tip_text_kwargs = {}
         if text_kwargs is not None:
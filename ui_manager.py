@@ -1,4 +1,5 @@
 import os
+from itertools import groupby
 from typing import Tuple, List, Dict, Union, Set, Optional
 
 import pygame
@@ -15,6 +16,7 @@ from pygame_gui.core.ui_window_stack import UIWindowStack
 from pygame_gui.core.ui_container import UIContainer
 from pygame_gui.core.resource_loaders import IResourceLoader, BlockingThreadedResourceLoader
 from pygame_gui.core.utility import PackageResource, get_default_manager, set_default_manager
+from pygame_gui.core.utility import render_white_text_alpha_black_bg
 from pygame_gui.core.layered_gui_group import LayeredGUIGroup
 from pygame_gui.core import ObjectID
 
@@ -94,6 +96,8 @@ class UIManager(IUIManagerInterface):
         self.mouse_pos_scale_factor = [1.0, 1.0]
 
         self.visual_debug_active = False
+        # layer text renders shared by elements in visual debug mode, keyed by (font, layer)
+        self._visual_debug_layer_texts = {}  # type: Dict[Tuple[object, int], pygame.Surface]
 
         self.resizing_window_cursors = None
         self._load_default_cursors()
@@ -205,6 +209,10 @@ class UIManager(IUIManagerInterface):
         """
         consumed_event = False
         sorting_consumed_event = False
+        # scale a left click position once here, rather than for every element we test it on
+        scaled_click_pos = None
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            scaled_click_pos = self.calculate_scaled_mouse_position(event.pos)
         sorted_layers = sorted(self.ui_group.layers(), reverse=True)
         for layer in sorted_layers:
             sprites_in_layer = self.ui_group.get_sprites_from_layer(layer)
@@ -218,9 +226,8 @@ class UIManager(IUIManagerInterface):
                 for ui_element in sprites_in_layer:
                     if ui_element.visible:
                         # Only process events for visible elements - ignore hidden elements
-                        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                            mouse_x, mouse_y = self.calculate_scaled_mouse_position(event.pos)
-                            if ui_element.hover_point(mouse_x, mouse_y):
+                        if scaled_click_pos is not None:
+                            if ui_element.hover_point(scaled_click_pos[0], scaled_click_pos[1]):
                                 self.set_focus_set(ui_element.get_focus_set())
 
                         consumed_event = ui_element.process_event(event)
@@ -302,9 +309,13 @@ class UIManager(IUIManagerInterface):
 
     def _handle_hovering(self, time_delta):
         hover_handled = False
-        sorted_layers = sorted(self.ui_group.layers(), reverse=True)
-        for layer in sorted_layers:
-            for ui_element in self.ui_group.get_sprites_from_layer(layer):
+        # The sprite group keeps its sprites sorted by layer, so we can split them into layers
+        # in a single pass rather than re-scanning every sprite for each layer.
+        sprites_by_layer = [list(layer_sprites) for _, layer_sprites in
+                            groupby(self.ui_group.sprites(),
+                                    key=self.ui_group.get_layer_of_sprite)]
+        for sprites_in_layer in reversed(sprites_by_layer):
+            for ui_element in sprites_in_layer:
                 if ui_element.visible:
                     # Only check hover for visible elements - ignore hidden elements
                     # we need to check hover even after already found what we are hovering
@@ -476,6 +487,7 @@ class UIManager(IUIManagerInterface):
             for layer in self.ui_group.layers():
                 for element in self.ui_group.get_sprites_from_layer(layer):
                     element.set_visual_debug_mode(self.visual_debug_active)
+            self._visual_debug_layer_texts.clear()
         elif not self.visual_debug_active and is_active:
             self.visual_debug_active = True
             # preload the debug font if it's not already loaded
@@ -488,6 +500,24 @@ class UIManager(IUIManagerInterface):
             # Finally print a version of the current layers to the console:
             self.print_layer_debug()
 
+    def get_visual_debug_layer_text(self, layer: int) -> pygame.surface.Surface:
+        """
+        Gets the 'UI Layer: n' text that elements draw over themselves in visual debug mode.
+        Renders are shared between all the elements on a layer, so don't draw on the surface.
+
+        :param layer: The layer to label.
+
+        :return: The rendered layer text.
+        """
+        default_font = self.get_theme().get_font_dictionary().get_default_font()
+        cache_key = (default_font, layer)
+        layer_text_render = self._visual_debug_layer_texts.get(cache_key)
+        if layer_text_render is None:
+            layer_text_render = render_white_text_alpha_black_bg(default_font,
+                                                                 "UI Layer: " + str(layer))
+            self._visual_debug_layer_texts[cache_key] = layer_text_render
+        return layer_text_render
+
     def print_layer_debug(self):
         """
         Print some formatted information on the current state of the UI Layers.
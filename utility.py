@@ -12,7 +12,7 @@ import io
 import base64
 
 from pathlib import Path
-from typing import Union, Dict, Tuple, Optional
+from typing import Union, Dict, Tuple, Optional, Iterable
 
 from threading import Thread
 from queue import Queue
@@ -307,6 +307,21 @@ def basic_blit(destination: pygame.surface.Surface,
     destination.blit(source, pos, area, special_flags=pygame.BLEND_PREMULTIPLIED)
 
 
+def basic_blits(destination: pygame.surface.Surface,
+                blit_sequence: Iterable[Tuple[pygame.surface.Surface,
+                                              Union[Tuple[int, int], pygame.Rect]]]):
+    """
+    Several basic_blit() calls onto the same destination surface in one go, so the destination
+    is only locked once.
+
+    :param destination: Destination surface to blit on to.
+    :param blit_sequence: (source surface, position) pairs, blitted in order.
+
+    """
+    destination.blits([(source, pos, None, pygame.BLEND_PREMULTIPLIED)
+                       for source, pos in blit_sequence], doreturn=False)
+
+
 def apply_colour_to_surface(colour: pygame.Color,
                             shape_surface: pygame.surface.Surface,
                             rect: Union[pygame.Rect, None] = None):